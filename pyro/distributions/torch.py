@@ -6,11 +6,25 @@ import numbers
 
 import torch
 from torch.distributions import constraints
+from torch.distributions.utils import lazy_property
 
 from pyro.distributions.constraints import IndependentConstraint
 from pyro.distributions.torch_distribution import TorchDistributionMixin
 from pyro.distributions.util import sum_rightmost
 
+_POISSON_MAX_RATE = 1e9
+
+
+def _beta_conjugate_update(c1a, c0a, c1b, c0b):
+    # This works directly on concentration tensors, so the updated Beta's
+    # .concentration1 and .concentration0 index views are never read.
+    c1 = c1a + c1b - 1
+    c0 = c0a + c0b - 1
+    log_normalizer = ((c1a + c0a).lgamma() + (c1b + c0b).lgamma() - (c1 + c0).lgamma()
+                      - c1a.lgamma() - c1b.lgamma() + c1.lgamma()
+                      - c0a.lgamma() - c0b.lgamma() + c0.lgamma())
+    return c1, c0, log_normalizer
+
 
 class Beta(torch.distributions.Beta, TorchDistributionMixin):
     def conjugate_update(self, other):
@@ -18,17 +32,36 @@ class Beta(torch.distributions.Beta, TorchDistributionMixin):
         EXPERIMENTAL.
         """
         assert isinstance(other, Beta)
-        concentration1 = self.concentration1 + other.concentration1 - 1
-        concentration0 = self.concentration0 + other.concentration0 - 1
+        concentration1, concentration0, log_normalizer = _beta_conjugate_update(
+            self.concentration1, self.concentration0, other.concentration1, other.concentration0)
         updated = Beta(concentration1, concentration0)
+        return updated, log_normalizer
 
-        def _log_normalizer(d):
-            x = d.concentration1
-            y = d.concentration0
-            return (x + y).lgamma() - x.lgamma() - y.lgamma()
 
-        log_normalizer = _log_normalizer(self) + _log_normalizer(other) - _log_normalizer(updated)
-        return updated, log_normalizer
+@torch.no_grad()
+def _binomial_approx_sample(total_count, p, q, shape, has_high_rate):
+    """
+    Approximates binomial samples with a moment-matched clamped Poisson.
+    ``has_high_rate`` should be true iff some rate exceeds
+    ``_POISSON_MAX_RATE``; it is passed in to avoid a device-to-host sync.
+    """
+    variance = p * q * total_count
+    shift = torch.min(p, q).mul_(total_count).sub_(variance).round_()
+    rate = variance.expand(shape)
+    # torch.poisson() is inaccurate at very high rates on CUDA,
+    # so we instead use a Normal approximation there.
+    if has_high_rate:
+        high_rate = variance > _POISSON_MAX_RATE
+        result = torch.poisson(rate.clamp(max=_POISSON_MAX_RATE))
+        normal = torch.randn(shape, dtype=rate.dtype, device=rate.device)
+        normal = normal.mul_(variance.sqrt()).add_(rate).round_().clamp_(min=0)
+        result = torch.where(high_rate, normal, result)
+    else:
+        result = torch.poisson(rate)
+    result = torch.min(result.add_(shift), total_count)
+    # Reflect samples where p >= q, folding the sign into batch-sized tensors.
+    flip = (p >= q).type_as(result)
+    return result.mul_(1 - 2 * flip).add_(total_count * flip)
 
 
 class Binomial(torch.distributions.Binomial, TorchDistributionMixin):
@@ -51,24 +84,41 @@ class Binomial(torch.distributions.Binomial, TorchDistributionMixin):
             new.logits = self.logits.expand(batch_shape)
             new._param = new.logits
         new.approx_sample_thresh = self.approx_sample_thresh
+        if '_total_count_min' in self.__dict__:
+            new._total_count_min = self._total_count_min
+        if '_has_high_rate' in self.__dict__:
+            new._has_high_rate = self._has_high_rate
         super(torch.distributions.Binomial, new).__init__(batch_shape, validate_args=False)
         new._validate_args = self._validate_args
         return new
 
+    @lazy_property
+    def _total_count_min(self):
+        # This is cached to avoid a device-to-host sync on each .sample().
+        return self.total_count.min().item()
+
+    @lazy_property
+    def _has_high_rate(self):
+        # This is cached to avoid a device-to-host sync on each .sample().
+        p, q = self._approx_sample_probs()
+        return bool((p * q * self.total_count > _POISSON_MAX_RATE).any())
+
+    def _approx_sample_probs(self):
+        if 'probs' not in self.__dict__:
+            # Avoid cancellation in 1 - probs when probs is near 1. Note we
+            # check probs rather than logits, since .logits may be lazily
+            # computed (and clamped) from .probs, e.g. by .log_prob().
+            logits = self.logits.detach()
+            return logits.sigmoid(), (-logits).sigmoid()
+        p = self.probs.detach()
+        return p, 1 - p
+
     def sample(self, sample_shape=torch.Size()):
         if self.approx_sample_thresh < math.inf:
-            if self.approx_sample_thresh < self.total_count.min():
-                # Approximate with a moment-matched clamped Poisson.
-                with torch.no_grad():
-                    shape = self._extended_shape(sample_shape)
-                    p = self.probs
-                    q = 1 - self.probs
-                    mean = torch.min(p, q) * self.total_count
-                    variance = p * q * self.total_count
-                    shift = (mean - variance).round()
-                    result = torch.poisson(variance.expand(shape))
-                    result = torch.min(result + shift, self.total_count)
-                    return torch.where(p < q, result, self.total_count - result)
+            if self.approx_sample_thresh < self._total_count_min:
+                shape = self._extended_shape(sample_shape)
+                p, q = self._approx_sample_probs()
+                return _binomial_approx_sample(self.total_count, p, q, shape, self._has_high_rate)
         return super().sample(sample_shape)
 
 
@@ -82,16 +132,19 @@ class Categorical(torch.distributions.Categorical, TorchDistributionMixin):
         if getattr(value, '_pyro_categorical_support', None) == id(self):
             # Assume value is a reshaped torch.arange(event_shape[0]).
             # In this case we can call .reshape() rather than torch.gather().
-            if not torch._C._get_tracing_state():
+            tracing = torch._C._get_tracing_state()
+            logits = self.logits
+            value_dim = value.dim()
+            if not tracing:
                 if self._validate_args:
                     self._validate_sample(value)
-                assert value.size(0) == self.logits.size(-1)
-            logits = self.logits
-            if logits.dim() <= value.dim():
-                logits = logits.reshape((1,) * (1 + value.dim() - logits.dim()) + logits.shape)
-            if not torch._C._get_tracing_state():
-                assert logits.size(-1 - value.dim()) == 1
-            return logits.transpose(-1 - value.dim(), -1).squeeze(-1)
+                assert value.size(0) == logits.size(-1)
+            pad = 1 + value_dim - logits.dim()
+            if pad > 0:
+                logits = logits.reshape((1,) * pad + logits.shape)
+            if not tracing:
+                assert logits.size(-1 - value_dim) == 1
+            return logits.transpose(-1 - value_dim, -1).squeeze(-1)
         return super().log_prob(value)
 
     def enumerate_support(self, expand=True):
@@ -101,21 +154,38 @@ class Categorical(torch.distributions.Categorical, TorchDistributionMixin):
         return result
 
 
+def _dirichlet_conjugate_update(ca, cb):
+    # This sums each concentration once, and reduces the elementwise lgamma
+    # terms of all three distributions in a single reduction.
+    c = ca + cb - 1
+    sa = ca.sum(-1)
+    sb = cb.sum(-1)
+    s = sa + sb - c.size(-1)
+    log_normalizer = (sa.lgamma() + sb.lgamma() - s.lgamma()
+                      - (ca.lgamma() + cb.lgamma() - c.lgamma()).sum(-1))
+    return c, log_normalizer
+
+
 class Dirichlet(torch.distributions.Dirichlet, TorchDistributionMixin):
     def conjugate_update(self, other):
         """
         EXPERIMENTAL.
         """
         assert isinstance(other, Dirichlet)
-        concentration = self.concentration + other.concentration - 1
+        concentration, log_normalizer = _dirichlet_conjugate_update(self.concentration, other.concentration)
         updated = Dirichlet(concentration)
+        return updated, log_normalizer
 
-        def _log_normalizer(d):
-            c = d.concentration
-            return c.sum(-1).lgamma() - c.lgamma().sum(-1)
 
-        log_normalizer = _log_normalizer(self) + _log_normalizer(other) - _log_normalizer(updated)
-        return updated, log_normalizer
+def _gamma_conjugate_update(ca, ra, cb, rb):
+    # This works directly on parameter tensors, so the updated Gamma's
+    # parameters are never read back.
+    c = ca + cb - 1
+    r = ra + rb
+    log_normalizer = (ra.log() * ca - ca.lgamma()
+                      + rb.log() * cb - cb.lgamma()
+                      - r.log() * c + c.lgamma())
+    return c, r, log_normalizer
 
 
 class Gamma(torch.distributions.Gamma, TorchDistributionMixin):
@@ -124,15 +194,9 @@ class Gamma(torch.distributions.Gamma, TorchDistributionMixin):
         EXPERIMENTAL.
         """
         assert isinstance(other, Gamma)
-        concentration = self.concentration + other.concentration - 1
-        rate = self.rate + other.rate
+        concentration, rate, log_normalizer = _gamma_conjugate_update(
+            self.concentration, self.rate, other.concentration, other.rate)
         updated = Gamma(concentration, rate)
-
-        def _log_normalizer(d):
-            c = d.concentration
-            return d.rate.log() * c - c.lgamma()
-
-        log_normalizer = _log_normalizer(self) + _log_normalizer(other) - _log_normalizer(updated)
         return updated, log_normalizer
 
 
@@ -141,7 +205,12 @@ class Geometric(torch.distributions.Geometric, TorchDistributionMixin):
     def log_prob(self, value):
         if self._validate_args:
             self._validate_sample(value)
-        return (-value - 1) * torch.nn.functional.softplus(self.logits) + self.logits
+        logits = self.logits
+        return value * torch.nn.functional.logsigmoid(-logits) + torch.nn.functional.logsigmoid(logits)
+
+
+# ExpTransform is stateless, so a single instance can be shared.
+_EXP_TRANSFORM = torch.distributions.transforms.ExpTransform()
 
 
 class LogNormal(torch.distributions.LogNormal, TorchDistributionMixin):
@@ -150,11 +219,17 @@ class LogNormal(torch.distributions.LogNormal, TorchDistributionMixin):
         # This differs from torch.distributions.LogNormal only in that base_dist is
         # a pyro.distributions.Normal rather than a torch.distributions.Normal.
         super(torch.distributions.LogNormal, self).__init__(
-            base_dist, torch.distributions.transforms.ExpTransform(), validate_args=validate_args)
+            base_dist, _EXP_TRANSFORM, validate_args=validate_args)
 
     def expand(self, batch_shape, _instance=None):
         new = self._get_checked_instance(LogNormal, _instance)
-        return super(torch.distributions.LogNormal, self).expand(batch_shape, _instance=new)
+        batch_shape = torch.Size(batch_shape)
+        new.base_dist = self.base_dist.expand(batch_shape)
+        new.transforms = self.transforms
+        super(torch.distributions.TransformedDistribution, new).__init__(
+            batch_shape, self.event_shape, validate_args=False)
+        new._validate_args = self._validate_args
+        return new
 
 
 class MultivariateNormal(torch.distributions.MultivariateNormal, TorchDistributionMixin):
@@ -182,8 +257,12 @@ class Independent(torch.distributions.Independent, TorchDistributionMixin):
         """
         EXPERIMENTAL.
         """
-        n = self.reintepreted_batch_ndims
-        updated, log_normalizer = self.base_dist.conjugate_update(other.to_event(-n))
+        n = self.reinterpreted_batch_ndims
+        if isinstance(other, torch.distributions.Independent) and other.reinterpreted_batch_ndims == n:
+            other = other.base_dist
+        else:
+            other = other.to_event(-n)
+        updated, log_normalizer = self.base_dist.conjugate_update(other)
         updated = updated.to_event(n)
         log_normalizer = sum_rightmost(log_normalizer, n)
         return updated, log_normalizer
@@ -208,28 +287,26 @@ class Uniform(torch.distributions.Uniform, TorchDistributionMixin):
 
 
 # Programmatically load all distributions from PyTorch.
-__all__ = []
-for _name, _Dist in torch.distributions.__dict__.items():
-    if not isinstance(_Dist, type):
-        continue
-    if not issubclass(_Dist, torch.distributions.Distribution):
-        continue
-    if _Dist is torch.distributions.Distribution:
-        continue
-
-    try:
-        _PyroDist = locals()[_name]
-    except KeyError:
-        _PyroDist = type(_name, (_Dist, TorchDistributionMixin), {})
-        _PyroDist.__module__ = __name__
-        locals()[_name] = _PyroDist
-
-    _PyroDist.__doc__ = '''
+_TORCH_DIST_NAMES = tuple(
+    _name for _name, _Dist in torch.distributions.__dict__.items()
+    if isinstance(_Dist, type)
+    and issubclass(_Dist, torch.distributions.Distribution)
+    and _Dist is not torch.distributions.Distribution)
+
+_WRAPPER_DOC = '''
     Wraps :class:`{}.{}` with
     :class:`~pyro.distributions.torch_distribution.TorchDistributionMixin`.
-    '''.format(_Dist.__module__, _Dist.__name__)
+    '''
+
+for _name in _TORCH_DIST_NAMES:
+    _Dist = getattr(torch.distributions, _name)
+    _PyroDist = globals().get(_name)
+    if _PyroDist is None:
+        _PyroDist = type(_name, (_Dist, TorchDistributionMixin), {'__module__': __name__})
+        globals()[_name] = _PyroDist
+    _PyroDist.__doc__ = _WRAPPER_DOC.format(_Dist.__module__, _Dist.__name__)
 
-    __all__.append(_name)
+__all__ = list(_TORCH_DIST_NAMES)
 
 
 # Create sphinx documentation.
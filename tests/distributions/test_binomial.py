@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+import torch
 
 import pyro.distributions as dist
 from tests.common import assert_close
@@ -33,3 +34,48 @@ def test_beta_binomial_approx_sample(concentration1, concentration0, total_count
 
     assert_close(expected.mean(), actual.mean(), rtol=0.1)
     assert_close(expected.std(), actual.std(), rtol=0.1)
+
+
+@pytest.mark.parametrize("prob", [0.1, 0.5, 0.9])
+def test_binomial_approx_sample_high_rate(prob):
+    sample_shape = (10000,)
+    total_count = torch.tensor(1e11, dtype=torch.float64)
+    d = dist.Binomial(total_count, prob, approx_sample_thresh=200)
+    actual = d.sample(sample_shape)
+
+    assert (actual >= 0).all()
+    assert (actual <= total_count).all()
+    mean = total_count * prob
+    std = (total_count * prob * (1 - prob)).sqrt()
+    assert_close((actual.mean() / mean).item(), 1., atol=1e-3)
+    assert_close((actual.std() / std).item(), 1., atol=0.05)
+
+
+@pytest.mark.parametrize("total_count", [1000, 4000])
+@pytest.mark.parametrize("logits", [-5., 0., 5.])
+def test_binomial_approx_sample_logits(total_count, logits):
+    sample_shape = (10000,)
+    d1 = dist.Binomial(total_count, logits=torch.tensor(logits))
+    d2 = dist.Binomial(total_count, logits=torch.tensor(logits), approx_sample_thresh=200)
+    expected = d1.sample(sample_shape)
+    actual = d2.sample(sample_shape)
+
+    assert_close(expected.mean(), actual.mean(), rtol=0.05)
+    assert_close(expected.std(), actual.std(), rtol=0.05)
+
+
+@pytest.mark.parametrize("prob", [0., 1.])
+def test_binomial_approx_sample_extreme_probs(prob):
+    total_count = 1e6
+    d = dist.Binomial(total_count, torch.tensor(prob), approx_sample_thresh=200)
+    d.log_prob(torch.tensor(total_count * prob))  # Lazily computes d.logits.
+    actual = d.sample((10000,))
+    assert (actual == total_count * prob).all()
+
+
+def test_binomial_approx_sample_logits_precision():
+    total_count = 1e7
+    logits = torch.tensor(20.)  # In float32, sigmoid(20) == 1 so 1 - probs == 0.
+    d = dist.Binomial(total_count, logits=logits, approx_sample_thresh=200)
+    failures = total_count - d.sample((10000,))
+    assert_close(failures.mean(), total_count * torch.sigmoid(-logits), rtol=0.2)
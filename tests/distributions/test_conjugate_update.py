@@ -54,3 +54,39 @@ def test_gamma_poisson(sample_shape, batch_shape):
 
     x = fg.sample(sample_shape)
     assert_close(f.log_prob(x) + g.log_prob(x), fg.log_prob(x) + log_normalizer)
+
+
+@pytest.mark.parametrize("sample_shape", [(), (4,), (3, 2)], ids=str)
+@pytest.mark.parametrize("batch_shape", [(), (4,), (3, 2)], ids=str)
+def test_independent_beta_binomial(sample_shape, batch_shape):
+    event_shape = (5,)
+    concentration1 = torch.randn(batch_shape + event_shape).exp()
+    concentration0 = torch.randn(batch_shape + event_shape).exp()
+    total = 10
+    obs = dist.Binomial(total, 0.2).sample(sample_shape + batch_shape + event_shape)
+
+    f = dist.Beta(concentration1, concentration0).to_event(1)
+    g = dist.Beta(1 + obs, 1 + total - obs).to_event(1)
+    fg, log_normalizer = f.conjugate_update(g)
+    assert fg.batch_shape == log_normalizer.shape
+    assert fg.event_shape == event_shape
+
+    x = fg.sample(sample_shape)
+    assert_close(f.log_prob(x) + g.log_prob(x), fg.log_prob(x) + log_normalizer)
+
+
+def test_independent_nested_beta_binomial():
+    concentration1 = torch.randn(4, 3, 2).exp()
+    concentration0 = torch.randn(4, 3, 2).exp()
+    total = 10
+    obs = dist.Binomial(total, 0.2).sample((4, 3, 2))
+
+    f = dist.Independent(dist.Beta(concentration1, concentration0).to_event(1), 1)
+    g = dist.Independent(dist.Beta(1 + obs, 1 + total - obs).to_event(1), 1)
+    fg, log_normalizer = f.conjugate_update(g)
+    assert not isinstance(fg.base_dist, dist.Independent)
+    assert fg.batch_shape == log_normalizer.shape == (4,)
+    assert fg.event_shape == (3, 2)
+
+    x = fg.sample()
+    assert_close(f.log_prob(x) + g.log_prob(x), fg.log_prob(x) + log_normalizer)
@@ -4,6 +4,8 @@
 import numpy as np
 import pytest
 import torch
+from torch.distributions import biject_to
+from torch.distributions.transforms import SigmoidTransform
 
 import pyro
 import pyro.distributions as dist
@@ -274,3 +276,9 @@ def test_expand_enumerate_support():
     d = dist.Categorical(probs)
     actual_enum_shape = TorchDistribution.expand(d, (4, 3)).enumerate_support(expand=True).shape
     assert actual_enum_shape == (6, 4, 3)
+
+
+@pytest.mark.parametrize("batch_shape", [(), (5,), (2, 3)], ids=str)
+def test_uniform_unit_interval_biject_to(batch_shape):
+    d = dist.Uniform(0., 1.).expand(batch_shape)
+    assert isinstance(biject_to(d.support), SigmoidTransform)